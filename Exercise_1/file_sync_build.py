@@ -0,0 +1,44 @@
+"""
+Shared build step for test.py and testing_part_3.py.
+
+file_sync.c is compiled once per version of its contents, into a private
+per-user cache directory, and both test scripts run the cached binary.
+"""
+
+import fcntl
+import hashlib
+import os
+import stat
+import subprocess
+
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "file_sync.c")
+
+
+def cache_dir():
+    """Return the per-user cache directory, creating it with mode 0700."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    path = os.path.join(root, "file_sync_test")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f"cache directory {path} must be a directory private to the current user")
+    return path
+
+
+def build_file_sync():
+    """Compile file_sync.c unless a binary for its current contents is cached; return its path.
+
+    Raises subprocess.CalledProcessError if gcc fails.
+    """
+    with open(SOURCE, "rb") as f:
+        digest = hashlib.file_digest(f, "sha256").hexdigest()[:16]
+    target = os.path.join(cache_dir(), f"file_sync.{digest}")
+    lock_fd = os.open(target + ".lock", os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    with os.fdopen(lock_fd, "w") as lock:
+        # Parallel test workers wait here instead of racing gcc
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not os.path.exists(target):
+            subprocess.run(["gcc", "-o", target + ".tmp", SOURCE], check=True)
+            os.replace(target + ".tmp", target)
+            print("Successfully compiled file_sync.c")
+    return target
@@ -1,267 +1,419 @@
 import sys
 import os
+import re
+import hashlib
+import shlex
 import shutil
 import subprocess
+import tempfile
+import atexit
+import io
+import contextlib
+import multiprocessing
 import time
-import filecmp
-
-EXECUTABLE = './file_sync'
+import traceback
+
+from file_sync_build import build_file_sync
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+EXECUTABLE = None  # defaults to the cached build of file_sync.c
+# TMPROOT goes on /dev/shm (tmpfs) when it exists and nothing is fsynced, so most
+# test writes never reach a disk. Without /dev/shm it falls back to the default
+# temp dir, and test_deep_directory_creation / test_different_parents always
+# write under /tmp and /var/tmp, which are usually disk-backed.
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+TMPROOT = None
+_created = []
+# Set by the pytest workdir fixture: print_result then raises on a FAIL
+ASSERT_RESULTS = False
+TMPFD = None
+
+# Expected file_sync output; templates are filled in with bytes via %
+MSG_USAGE = b"Usage: file_sync <source_directory> <destination_directory>"
+MSG_NO_SOURCE = b"Error: Source directory '%s' does not exist."
+MSG_CREATED = b"Created destination directory '%s'."
+MSG_NEW_FILE = b"New file found: %s"
+MSG_IDENTICAL = b"File %s is identical. Skipping..."
+MSG_NEWER_SRC = b"File %s is newer in source. Updating..."
+MSG_NEWER_DEST = b"File %s is newer in destination. Skipping..."
+MSG_COMPLETE = b"Synchronization complete."
+_NFF = re.compile(rb'New file found: (.+)')
 
 
 def run(cmd):
-    """Run a command and return (stdout + stderr, exit_code)."""
-    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    return result.stdout.strip(), result.returncode
+    """Run a command and return (stdout + stderr as bytes, exit_code)."""
+    fd = os.memfd_create('out')
+    try:
+        result = subprocess.run(cmd, stdout=fd, stderr=subprocess.STDOUT)
+        # The child shares our file offset, so it is also the output size
+        size = os.lseek(fd, 0, os.SEEK_CUR)
+        output = os.pread(fd, size, 0)
+    finally:
+        os.close(fd)
+    return output.strip(), result.returncode
 
 
-def clean_dir(path):
-    if os.path.exists(path):
-        shutil.rmtree(path)
+def run_batch(*arg_lists):
+    """Run several EXECUTABLE invocations in one shell, returning [(output, exit_code), ...]."""
+    script = "; ".join(
+        " ".join(shlex.quote(arg) for arg in [EXECUTABLE, *args]) + '; echo "--- $?"'
+        for args in arg_lists)
+    output, _ = run(['sh', '-c', script])
+    parts = re.split(rb'^--- (\d+)$', output, flags=re.M)
+    return [(parts[i], int(parts[i + 1])) for i in range(0, len(parts) - 1, 2)]
 
 
-def create_file(path, content="", delay=False):
-    with open(path, 'w') as f:
-        f.write(content)
-    if delay:
-        time.sleep(1)  # Ensure mod time differs
+def _open_tmpfd():
+    global TMPFD
+    TMPFD = os.open('/tmp', os.O_RDONLY | os.O_DIRECTORY)
+    atexit.register(os.close, TMPFD)
 
 
-def print_result(test_name, passed, output=None):
-    print(f"[{'PASS' if passed else 'FAIL'}] {test_name}")
-    if not passed and output:
-        print("Output:")
-        print(output)
-        print('-' * 40)
+def setup_module():
+    """Build file_sync if needed, create the scratch root on tmpfs and remove it once at exit."""
+    global TMPROOT, EXECUTABLE
+    if EXECUTABLE is None:
+        EXECUTABLE = build_file_sync()
+    TMPROOT = tempfile.mkdtemp(dir=SCRATCH_DIR)
+    atexit.register(shutil.rmtree, TMPROOT, ignore_errors=True)
+    _open_tmpfd()
 
 
-def test_usage_message():
-    output, code = run([EXECUTABLE])
-    expected = "Usage: file_sync <source_directory> <destination_directory>"
-    print_result("Incorrect args (no args)", expected in output and code == 1, output)
+def init_worker(tmproot, executable):
+    """Pool initializer: adopt the parent's scratch root and executable.
 
+    Workers started with spawn/forkserver do not inherit module globals set in
+    the parent, so they are passed in explicitly.
+    """
+    global TMPROOT, EXECUTABLE
+    TMPROOT = tmproot
+    EXECUTABLE = executable
+    _open_tmpfd()
 
-def test_missing_source():
-    dest = 'test_dest'
-    clean_dir(dest)
-    output, code = run([EXECUTABLE, 'nonexistent_src', dest])
-    expected = "Error: Source directory 'nonexistent_src' does not exist."
-    print_result("Missing source dir", expected in output and code == 1, output)
 
+def make_dir(path):
+    os.mkdir(path)
+    _created.append(path)
 
-def test_create_destination():
-    src, dest = 'test_src', 'test_new_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    create_file(os.path.join(src, 'a.txt'), 'Hello!')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "Created destination directory 'test_new_dest'." in output and "New file found: a.txt" in output
-    print_result("Create destination dir", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
+def make_tmp_dir(name):
+    """Create /tmp/<name> relative to the open TMPFD and return its path."""
+    os.mkdir(name, dir_fd=TMPFD)
+    path = os.path.join('/tmp', name)
+    _created.append(path)
+    return path
 
-def test_identical_files():
-    src, dest = 'test_src', 'test_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    create_file(os.path.join(src, 'a.txt'), 'same content')
-    create_file(os.path.join(dest, 'a.txt'), 'same content')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "File a.txt is identical. Skipping..." in output
-    print_result("Identical files", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
+def _remove_dir(path):
+    # file_sync copies files we never tracked into the destination
+    for name in os.listdir(path):
+        os.unlink(os.path.join(path, name))
+    os.rmdir(path)
 
-def test_file_update():
-    src, dest = 'test_src', 'test_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    create_file(os.path.join(dest, 'a.txt'), 'old content')
-    time.sleep(1)
-    create_file(os.path.join(src, 'a.txt'), 'new content')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "File a.txt is newer in source. Updating..." in output
-    print_result("Newer file in source", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
+def clean_dir(path):
+    """Remove what the tests created under path, newest first (no tree walk)."""
+    prefix = path + os.sep
+    tracked = [p for p in _created if p == path or p.startswith(prefix)]
+    for p in tracked:
+        _created.remove(p)
+    if not path.startswith(TMPROOT):
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    for p in reversed(tracked):
+        if os.path.isdir(p):
+            _remove_dir(p)
+        else:
+            os.unlink(p)
+    if os.path.isdir(path):
+        _remove_dir(path)
+
+
+@contextlib.contextmanager
+def scratch(workdir, create_dest=True):
+    """Yield (src, dest) under workdir and remove what the test created there."""
+    src, dest = os.path.join(workdir, 'src'), os.path.join(workdir, 'dest')
+    make_dir(src)
+    if create_dest:
+        make_dir(dest)
+    try:
+        yield src, dest
+    finally:
+        clean_dir(src)
+        clean_dir(dest)
+
+
+def create_file(path, content=""):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.write(fd, content.encode())
+    os.close(fd)
+    _created.append(path)
+
+
+def create_files(path, contents):
+    """Create several files in path, opening each relative to one directory fd."""
+    dirfd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name, content in contents.items():
+            fd = os.open(name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dirfd)
+            os.write(fd, content.encode())
+            os.close(fd)
+            _created.append(os.path.join(path, name))
+    finally:
+        os.close(dirfd)
+
+
+def listdir_set(path):
+    return {entry.name for entry in os.scandir(path) if entry.is_file(follow_symlinks=False)}
+
+
+def same_content(a, b):
+    """Compare sizes first, then SHA-256 digests computed by hashlib's C read loop."""
+    try:
+        if os.path.getsize(a) != os.path.getsize(b):
+            return False
+        with open(a, 'rb') as fa, open(b, 'rb') as fb:
+            return hashlib.file_digest(fa, 'sha256').digest() == hashlib.file_digest(fb, 'sha256').digest()
+    except FileNotFoundError:
+        return False
+
+
+def touch(path, mtime):
+    os.utime(path, (mtime, mtime))
 
-def test_file_skip_update():
-    src, dest = 'test_src', 'test_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    create_file(os.path.join(src, 'a.txt'), 'old content')
-    time.sleep(1)
-    create_file(os.path.join(dest, 'a.txt'), 'new content')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "File a.txt is newer in destination. Skipping..." in output
-    print_result("Newer file in destination", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
+def print_result(test_name, passed, output=None):
+    print(f"[{'PASS' if passed else 'FAIL'}] {test_name}")
+    if not passed and output:
+        print("Output:")
+        print(output.decode(errors='replace') if isinstance(output, bytes) else output)
+        print('-' * 40)
+    if ASSERT_RESULTS and not passed:
+        raise AssertionError(f"{test_name} failed")
 
-def test_new_file_copy():
-    src, dest = 'test_src', 'test_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    create_file(os.path.join(src, 'b.txt'), 'brand new file')
-    output, code = run([EXECUTABLE, src, dest])
-    dest_file = os.path.join(dest, 'b.txt')
-    passed = os.path.exists(dest_file) and filecmp.cmp(os.path.join(src, 'b.txt'), dest_file)
-    print_result("Copy new file", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
+def test_missing_source(workdir):
+    dest = os.path.join(workdir, 'test_dest')
+    output, code = run([EXECUTABLE, 'nonexistent_src', dest])
+    expected = MSG_NO_SOURCE % b'nonexistent_src'
+    print_result("Missing source dir", expected in output and code == 1, output)
 
-def test_max_file_limit():
-    src, dest = 'test_src', 'test_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    for i in range(100):
-        create_file(os.path.join(src, f'file{i:03}.txt'), f'File {i}')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "Synchronization complete." in output
-    print_result("Handle 100 files", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
 
-def test_deep_directory_creation():
-    src = 'test_src'
+def test_create_destination(workdir):
+    with scratch(workdir, create_dest=False) as (src, dest):
+        create_file(os.path.join(src, 'a.txt'), 'Hello!')
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_CREATED % dest.encode() in output and MSG_NEW_FILE % b'a.txt' in output
+        print_result("Create destination dir", passed, output)
+
+
+def test_identical_files(workdir):
+    with scratch(workdir) as (src, dest):
+        create_file(os.path.join(src, 'a.txt'), 'same content')
+        create_file(os.path.join(dest, 'a.txt'), 'same content')
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_IDENTICAL % b'a.txt' in output
+        print_result("Identical files", passed, output)
+
+
+def test_file_update(workdir):
+    with scratch(workdir) as (src, dest):
+        now = time.time()
+        create_file(os.path.join(dest, 'a.txt'), 'old content')
+        touch(os.path.join(dest, 'a.txt'), now - 10)
+        create_file(os.path.join(src, 'a.txt'), 'new content')
+        touch(os.path.join(src, 'a.txt'), now)
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_NEWER_SRC % b'a.txt' in output
+        print_result("Newer file in source", passed, output)
+
+
+def test_file_skip_update(workdir):
+    with scratch(workdir) as (src, dest):
+        now = time.time()
+        create_file(os.path.join(src, 'a.txt'), 'old content')
+        touch(os.path.join(src, 'a.txt'), now - 10)
+        create_file(os.path.join(dest, 'a.txt'), 'new content')
+        touch(os.path.join(dest, 'a.txt'), now)
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_NEWER_DEST % b'a.txt' in output
+        print_result("Newer file in destination", passed, output)
+
+
+def test_new_file_copy(workdir):
+    with scratch(workdir) as (src, dest):
+        create_file(os.path.join(src, 'b.txt'), 'brand new file')
+        output, code = run([EXECUTABLE, src, dest])
+        dest_file = os.path.join(dest, 'b.txt')
+        passed = listdir_set(dest) == {'b.txt'} and same_content(os.path.join(src, 'b.txt'), dest_file)
+        print_result("Copy new file", passed, output)
+
+
+def test_max_file_limit(workdir):
+    with scratch(workdir) as (src, dest):
+        create_files(src, {f'file{i:03}.txt': f'File {i}' for i in range(100)})
+        output, code = run([EXECUTABLE, src, dest])
+        expected = {f'file{i:03}.txt' for i in range(100)}
+        passed = MSG_COMPLETE in output and listdir_set(dest) == expected
+        print_result("Handle 100 files", passed, output)
+
+def remove_deep_dest(dest, name, levels):
+    """Remove dest/name, then dest and its parents up to `levels` dirs, without scanning them."""
+    try:
+        os.remove(os.path.join(dest, name))
+    except OSError:
+        pass
+    for _ in range(levels):
+        try:
+            os.rmdir(dest)
+        except OSError:
+            pass
+        dest = os.path.dirname(dest)
+
+
+def test_deep_directory_creation(workdir):
     dest = os.path.join('/tmp', 'new1', 'new2', 'new3')
-    clean_dir(src)
-    clean_dir('/tmp/new1')
-    os.mkdir(src)
-    create_file(os.path.join(src, 'x.txt'), 'deep')
-    output, code = run([EXECUTABLE, src, dest])
-    expected = f"Created destination directory '{dest}'."
-    passed = expected in output and os.path.exists(os.path.join(dest, 'x.txt'))
-    print_result("Deep destination dir creation", passed, output)
-    clean_dir(src)
-    clean_dir('/tmp/new1')
-
-def test_different_parents():
+    remove_deep_dest(dest, 'x.txt', 3)
+    try:
+        with scratch(workdir, create_dest=False) as (src, _):
+            create_file(os.path.join(src, 'x.txt'), 'deep')
+            output, code = run([EXECUTABLE, src, dest])
+            expected = MSG_CREATED % dest.encode()
+            passed = expected in output and os.path.exists(os.path.join(dest, 'x.txt'))
+            print_result("Deep destination dir creation", passed, output)
+    finally:
+        remove_deep_dest(dest, 'x.txt', 3)
+
+def test_different_parents(workdir):
     src = '/tmp/test_src_other'
     dest = '/var/tmp/test_dest_other'
     clean_dir(src)
     clean_dir(dest)
-    os.makedirs(src)
-    os.makedirs(dest)
-    create_file(os.path.join(src, 'unique.txt'), 'diff parent')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "New file found: unique.txt" in output
-    print_result("Different parent folders", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
-
-
-def test_relative_vs_absolute():
-    os.makedirs('rel_src', exist_ok=True)
-    os.makedirs('rel_dest', exist_ok=True)
-    create_file('rel_src/test.txt', 'test content')
-    abs_src = os.path.abspath('rel_src')
-    rel_dest = 'rel_dest'
-    output, code = run([EXECUTABLE, abs_src, rel_dest])
-    passed = "New file found: test.txt" in output
-    print_result("Relative vs absolute path mix", passed, output)
-    clean_dir('rel_src')
-    clean_dir('rel_dest')
-
+    try:
+        make_tmp_dir('test_src_other')
+        make_dir(dest)
+        create_file(os.path.join(src, 'unique.txt'), 'diff parent')
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_NEW_FILE % b'unique.txt' in output
+        print_result("Different parent folders", passed, output)
+    finally:
+        clean_dir(src)
+        clean_dir(dest)
+
+
+def test_relative_vs_absolute(workdir):
+    with scratch(workdir) as (src, dest):
+        create_file(os.path.join(src, 'test.txt'), 'test content')
+        abs_src = os.path.abspath(src)
+        rel_dest = os.path.relpath(dest)
+        output, code = run([EXECUTABLE, abs_src, rel_dest])
+        passed = MSG_NEW_FILE % b'test.txt' in output
+        print_result("Relative vs absolute path mix", passed, output)
+
+
+def test_empty_source_dir(workdir):
+    with scratch(workdir) as (src, dest):
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_COMPLETE in output and not _NFF.search(output)
+        print_result("Empty source directory", passed, output)
+
+
+def test_files_with_spaces(workdir):
+    with scratch(workdir) as (src, dest):
+        create_file(os.path.join(src, 'file with space.txt'), 'spaced out')
+        output, code = run([EXECUTABLE, src, dest])
+        passed = MSG_NEW_FILE % b'file with space.txt' in output
+        print_result("Files with spaces", passed, output)
+
+
+def test_ignore_subdirectories(workdir):
+    with scratch(workdir) as (src, dest):
+        make_dir(os.path.join(src, 'subdir'))  # should be ignored
+        create_file(os.path.join(src, 'realfile.txt'), 'real file')
+        output, code = run([EXECUTABLE, src, dest])
+        passed = b"realfile.txt" in output and b"subdir" not in output
+        print_result("Skip subdirectories", passed, output)
+
+def test_alphabetical_order(workdir):
+    with scratch(workdir) as (src, dest):
+
+        # Create files in non-alphabetical order
+        filenames = ['zeta.txt', 'alpha.txt', 'delta.txt', 'beta.txt']
+        for name in filenames:
+            create_file(os.path.join(src, name), f'Content of {name}')
+
+        output, code = run([EXECUTABLE, src, dest])
+
+        # Extract files mentioned in output
+        reported = [name.decode() for name in _NFF.findall(output)]
+
+        passed = reported == sorted(filenames)
+        print_result("Alphabetical order check", passed, "\nReported order:\n" + "\n".join(reported))
+
+def test_arg_validation(workdir):
+    runs = run_batch([], ['x'], ['x', 'y', 'z'])
+    passed = len(runs) == 3 and all(MSG_USAGE in out and code == 1 for out, code in runs)
+    report = b'\n'.join(b'%s\n(exit code %d)' % (out.strip(), code) for out, code in runs)
+    print_result("Incorrect args (no args, 1 arg, 3 args)", passed, report)
+
+
+TESTS = [
+    test_missing_source,
+    test_create_destination,
+    test_identical_files,
+    test_file_update,
+    test_file_skip_update,
+    test_new_file_copy,
+    test_max_file_limit,
+    test_deep_directory_creation,
+    test_different_parents,
+    test_relative_vs_absolute,
+    test_empty_source_dir,
+    test_files_with_spaces,
+    test_ignore_subdirectories,
+    test_alphabetical_order,
+    test_arg_validation,
+]
+
+
+if pytest is not None:
+    @pytest.fixture
+    def workdir():
+        global ASSERT_RESULTS
+        ASSERT_RESULTS = True
+        path = tempfile.mkdtemp(dir=TMPROOT)
+        yield path
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def run_test(test):
+    """Run one test in its own scratch dir and return what it printed.
+
+    An exception inside the test is reported as a FAIL so the other reports survive.
+    """
+    workdir = tempfile.mkdtemp(dir=TMPROOT)
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            try:
+                test(workdir)
+            except Exception:
+                print_result(test.__name__, False, traceback.format_exc())
+    finally:
+        # Empty unless the test failed part-way through
+        shutil.rmtree(workdir, ignore_errors=True)
+    return buf.getvalue()
 
-def test_empty_source_dir():
-    src, dest = 'empty_src', 'empty_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "Synchronization complete." in output and "New file found" not in output
-    print_result("Empty source directory", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
-
-
-def test_files_with_spaces():
-    src, dest = 'space_src', 'space_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    create_file(os.path.join(src, 'file with space.txt'), 'spaced out')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "New file found: file with space.txt" in output
-    print_result("Files with spaces", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
-
-
-def test_ignore_subdirectories():
-    src, dest = 'src_with_dirs', 'dest_with_dirs'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-    os.mkdir(os.path.join(src, 'subdir'))  # should be ignored
-    create_file(os.path.join(src, 'realfile.txt'), 'real file')
-    output, code = run([EXECUTABLE, src, dest])
-    passed = "realfile.txt" in output and "subdir" not in output
-    print_result("Skip subdirectories", passed, output)
-    clean_dir(src)
-    clean_dir(dest)
-
-def test_alphabetical_order():
-    src, dest = 'alpha_src', 'alpha_dest'
-    clean_dir(src)
-    clean_dir(dest)
-    os.mkdir(src)
-    os.mkdir(dest)
-
-    # Create files in non-alphabetical order
-    filenames = ['zeta.txt', 'alpha.txt', 'delta.txt', 'beta.txt']
-    for name in filenames:
-        create_file(os.path.join(src, name), f'Content of {name}')
-
-    output, code = run([EXECUTABLE, src, dest])
-
-    # Extract files mentioned in output
-    reported = []
-    for line in output.splitlines():
-        if "New file found:" in line:
-            fname = line.split("New file found:")[-1].strip()
-            reported.append(fname)
-
-    passed = reported == sorted(filenames)
-    print_result("Alphabetical order check", passed, "\nReported order:\n" + "\n".join(reported))
-    
-    clean_dir(src)
-    clean_dir(dest)
 
 if __name__ == "__main__":
     EXECUTABLE = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] else EXECUTABLE
+    setup_module()
 
-    test_usage_message()
-    test_missing_source()
-    test_create_destination()
-    test_identical_files()
-    test_file_update()
-    test_file_skip_update()
-    test_new_file_copy()
-    test_max_file_limit()
-    test_deep_directory_creation()
-    test_different_parents()
-    test_relative_vs_absolute()
-    test_empty_source_dir()
-    test_files_with_spaces()
-    test_ignore_subdirectories()
-    test_alphabetical_order()
+    with multiprocessing.Pool(processes=os.cpu_count(), initializer=init_worker,
+                              initargs=(TMPROOT, EXECUTABLE)) as pool:
+        for report in pool.map(run_test, TESTS, chunksize=1):
+            print(report, end='')
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 import os
+import re
+import shlex
 import shutil
 import subprocess
+import tempfile
 import time
 import sys
 import unittest
+import importlib.util
+
+from file_sync_build import build_file_sync
 
 """
 A comprehensive testing script for file_sync.c
@@ -17,28 +23,50 @@ Tests various scenarios including:
 - Empty directories
 """
 
+# Per-test directories are made under /dev/shm when available; otherwise
+# tempfile's default (normally disk-backed) location is used.
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Expected file_sync output; templates are filled in with str.format
+MSG_USAGE = "Usage: file_sync <source_directory> <destination_directory>"
+MSG_NO_SOURCE = "Error: Source directory '{}' does not exist."
+MSG_CREATED = "Created destination directory '{}'."
+MSG_NEW_FILE = "New file found: {}"
+MSG_IDENTICAL = "File {} is identical. Skipping..."
+MSG_NEWER_SRC = "File {} is newer in source. Updating..."
+MSG_NEWER_DEST = "File {} is newer in destination. Skipping..."
+MSG_COMPLETE = "Synchronization complete."
+_NFF = re.compile(r"New file found: (.+)")
+
+
+def listdir_set(path):
+    return {entry.name for entry in os.scandir(path) if entry.is_file(follow_symlinks=False)}
+
+
+def touch(path, mtime):
+    os.utime(path, (mtime, mtime))
+
+
 class FileSyncTest(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        # Compile the program first
+        # Compile the program once per version of file_sync.c (shared with test.py)
         try:
-            subprocess.run(["gcc", "-o", "file_sync", "file_sync.c"], check=True)
-            print("Successfully compiled file_sync.c")
+            cls.executable = build_file_sync()
         except subprocess.CalledProcessError:
             print("Error compiling file_sync.c")
             sys.exit(1)
+        except PermissionError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     
     def setUp(self):
-        # Create test directories
-        self.test_dir = "file_sync_test"
+        # Create test directories, unique per test so tests can run in parallel
+        self.test_dir = tempfile.mkdtemp(prefix="file_sync_test_", dir=SCRATCH_DIR)
         self.source_dir = os.path.join(self.test_dir, "source")
         self.dest_dir = os.path.join(self.test_dir, "dest")
         
-        # Remove any existing test directories
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-        
         # Create fresh source directory
         os.makedirs(self.source_dir)
     
@@ -47,19 +75,28 @@ class FileSyncTest(unittest.TestCase):
         if os.path.exists(self.test_dir):
             shutil.rmtree(self.test_dir)
     
-    def create_test_file(self, path, content, sleep_time=1):
+    def create_test_file(self, path, content):
         with open(path, 'w') as f:
             f.write(content)
-        time.sleep(sleep_time)  # Ensure different modification times
     
     def run_file_sync(self, src_dir, dest_dir, expected_return_code=0):
-        result = subprocess.run(["./file_sync", src_dir, dest_dir], 
+        result = subprocess.run([self.executable, src_dir, dest_dir], 
                                capture_output=True, text=True)
         if expected_return_code is not None:
             self.assertEqual(result.returncode, expected_return_code, 
                            f"Expected return code {expected_return_code}, got {result.returncode}. Stderr: {result.stderr}")
         return result.stdout, result.stderr, result.returncode
     
+    def run_file_sync_batch(self, *arg_lists):
+        """Run several file_sync invocations in one shell, returning [(stdout, return_code), ...]."""
+        script = "; ".join(
+            " ".join(shlex.quote(arg) for arg in [self.executable, *args]) + '; echo "--- $?"'
+            for args in arg_lists)
+        # stderr is kept apart so callers only see what file_sync printed to stdout
+        result = subprocess.run(["sh", "-c", script], capture_output=True, text=True)
+        parts = re.split(r"^--- (\d+)$", result.stdout, flags=re.M)
+        return [(parts[i], int(parts[i + 1])) for i in range(0, len(parts) - 1, 2)]
+    
     def test_basic_sync(self):
         """Test basic file synchronization."""
         # Create test files
@@ -70,13 +107,12 @@ class FileSyncTest(unittest.TestCase):
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Verify files were copied
-        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "file1.txt")))
-        self.assertTrue(os.path.exists(os.path.join(self.dest_dir, "file2.txt")))
+        self.assertEqual(listdir_set(self.dest_dir), {"file1.txt", "file2.txt"})
         
         # Verify output message
-        self.assertIn("New file found: file1.txt", stdout)
-        self.assertIn("New file found: file2.txt", stdout)
-        self.assertIn("Synchronization complete", stdout)
+        self.assertIn(MSG_NEW_FILE.format("file1.txt"), stdout)
+        self.assertIn(MSG_NEW_FILE.format("file2.txt"), stdout)
+        self.assertIn(MSG_COMPLETE, stdout)
         
         print("Basic synchronization test passed.")
     
@@ -85,7 +121,7 @@ class FileSyncTest(unittest.TestCase):
         stdout, _, return_code = self.run_file_sync("nonexistent_dir", self.dest_dir, expected_return_code=1)
         
         # Verify error message
-        self.assertIn("does not exist", stdout)
+        self.assertIn(MSG_NO_SOURCE.format("nonexistent_dir"), stdout)
         
         print("Non-existent source directory test passed.")
     
@@ -102,7 +138,7 @@ class FileSyncTest(unittest.TestCase):
         
         # Verify destination was created
         self.assertTrue(os.path.exists(new_dest))
-        self.assertIn(f"Created destination directory '{new_dest}'", stdout)
+        self.assertIn(MSG_CREATED.format(new_dest), stdout)
         
         print("Create destination directory test passed.")
     
@@ -111,18 +147,21 @@ class FileSyncTest(unittest.TestCase):
         # Create destination directory
         os.makedirs(self.dest_dir)
         
+        now = time.time()
+
         # Create older file in destination
         self.create_test_file(os.path.join(self.dest_dir, "file1.txt"), "Old content")
-        time.sleep(2)  # Ensure time difference
+        touch(os.path.join(self.dest_dir, "file1.txt"), now - 10)
         
         # Create newer file in source
         self.create_test_file(os.path.join(self.source_dir, "file1.txt"), "New content")
+        touch(os.path.join(self.source_dir, "file1.txt"), now)
         
         # Run file sync
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Verify file was updated
-        self.assertIn("is newer in source", stdout)
+        self.assertIn(MSG_NEWER_SRC.format("file1.txt"), stdout)
         with open(os.path.join(self.dest_dir, "file1.txt"), 'r') as f:
             self.assertEqual(f.read(), "New content")
         
@@ -133,18 +172,21 @@ class FileSyncTest(unittest.TestCase):
         # Create destination directory
         os.makedirs(self.dest_dir)
         
-        # Create newer file in destination
+        now = time.time()
+
+        # Create older file in source
         self.create_test_file(os.path.join(self.source_dir, "file1.txt"), "Old content")
-        time.sleep(2)  # Ensure time difference
+        touch(os.path.join(self.source_dir, "file1.txt"), now - 10)
         
         # Create newer file in destination
         self.create_test_file(os.path.join(self.dest_dir, "file1.txt"), "Newer content")
+        touch(os.path.join(self.dest_dir, "file1.txt"), now)
         
         # Run file sync
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Verify file was not updated
-        self.assertIn("is newer in destination", stdout)
+        self.assertIn(MSG_NEWER_DEST.format("file1.txt"), stdout)
         with open(os.path.join(self.dest_dir, "file1.txt"), 'r') as f:
             self.assertEqual(f.read(), "Newer content")
         
@@ -163,7 +205,7 @@ class FileSyncTest(unittest.TestCase):
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Verify file was identified as identical
-        self.assertIn("is identical", stdout)
+        self.assertIn(MSG_IDENTICAL.format("file1.txt"), stdout)
         
         print("Identical files test passed.")
     
@@ -175,23 +217,19 @@ class FileSyncTest(unittest.TestCase):
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Verify synchronization completes without errors
-        self.assertIn("Synchronization complete", stdout)
+        self.assertIn(MSG_COMPLETE, stdout)
         
         print("Empty source directory test passed.")
     
     def test_invalid_args(self):
         """Test with invalid number of arguments."""
-        # Test with only one argument
-        result = subprocess.run(["./file_sync", self.source_dir], 
-                                capture_output=True, text=True)
-        self.assertEqual(result.returncode, 1)
-        self.assertIn("Usage:", result.stdout)
-        
-        # Test with three arguments
-        result = subprocess.run(["./file_sync", self.source_dir, self.dest_dir, "extra_arg"], 
-                               capture_output=True, text=True)
-        self.assertEqual(result.returncode, 1)
-        self.assertIn("Usage:", result.stdout)
+        # Test with no arguments, one argument and three arguments
+        runs = self.run_file_sync_batch([], [self.source_dir],
+                                        [self.source_dir, self.dest_dir, "extra_arg"])
+        self.assertEqual(len(runs), 3)
+        for stdout, return_code in runs:
+            self.assertEqual(return_code, 1)
+            self.assertIn(MSG_USAGE, stdout)
         
         print("Invalid arguments test passed.")
     
@@ -206,38 +244,19 @@ class FileSyncTest(unittest.TestCase):
         stdout, _, _ = self.run_file_sync(self.source_dir, self.dest_dir)
         
         # Check order of processing in output
-        a_pos = stdout.find("New file found: a_file.txt")
-        b_pos = stdout.find("New file found: b_file.txt")
-        c_pos = stdout.find("New file found: c_file.txt")
+        reported = _NFF.findall(stdout)
         
-        self.assertTrue(a_pos < b_pos < c_pos, "Files were not processed in alphabetical order")
+        self.assertEqual(reported, ["a_file.txt", "b_file.txt", "c_file.txt"],
+                         "Files were not processed in alphabetical order")
         
         print("Alphabetical order test passed.")
 
-class CustomTestResult(unittest.TextTestResult):
-    def __init__(self, stream, descriptions, verbosity):
-        super().__init__(stream, descriptions, verbosity)
-        self.tests_run = 0
-        self.tests_failed = 0
-    
-    def startTest(self, test):
-        super().startTest(test)
-        self.tests_run += 1
-    
-    def addFailure(self, test, err):
-        super().addFailure(test, err)
-        self.tests_failed += 1
-    
-    def addError(self, test, err):
-        super().addError(test, err)
-        self.tests_failed += 1
-
 if __name__ == "__main__":
     print("Starting file_sync tests...")
-    runner = unittest.TextTestRunner(verbosity=2, resultclass=CustomTestResult)
-    result = runner.run(unittest.makeSuite(FileSyncTest))
-    
-    if result.tests_failed == 0 and result.tests_run > 0:
-        print("\n✓ SUCCESS! All tests passed!")
-    else:
-        print(f"\nTests failed: {result.tests_failed}/{result.tests_run}")
\ No newline at end of file
+    try:
+        import pytest
+    except ImportError:
+        unittest.main(verbosity=2)
+    # Spread the tests over all cores when pytest-xdist is available
+    args = ["-n", "auto"] if importlib.util.find_spec("xdist") else []
+    sys.exit(pytest.main(args + ["-v", __file__]))